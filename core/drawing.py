@@ -0,0 +1,118 @@
+"""
+Drawing helpers for MatrixPortal S3 Dashboard
+Region operations shared by plugin render paths
+"""
+try:
+    import displayio
+    import bitmaptools
+except ImportError:
+    # Not running on CircuitPython; clear_region and RegionCache use plain Python
+    displayio = None
+    bitmaptools = None
+
+# One row of background pixels for the widest supported panel. Narrower
+# regions take a memoryview slice, so clearing never allocates per frame.
+_ZERO_ROW = bytes(256)
+
+def _flat_view(buffer):
+    """
+    Return (memoryview, stride) when buffer stores one item per pixel in
+    row-major order (a 256-colour displayio.Bitmap does), else (None, 0).
+    """
+    try:
+        mv = memoryview(buffer)
+        stride = buffer.width
+        if len(mv) == stride * buffer.height:
+            return mv, stride
+    except (TypeError, AttributeError):
+        pass
+    return None, 0
+
+def clear_region(buffer, x0, y0, x1, y1):
+    """
+    Clear pixels with x0 <= x < x1 and y0 <= y < y1 to color 0.
+
+    Bounds must already be clamped to the buffer. A displayio.Bitmap is
+    filled in C by bitmaptools; other flat buffers are cleared a row at a
+    time with slice writes, and anything else falls back to per-pixel
+    writes.
+    """
+    row_width = x1 - x0
+    if row_width <= 0 or y1 <= y0:
+        return
+
+    if bitmaptools is not None:
+        try:
+            bitmaptools.fill_region(buffer, x0, y0, x1, y1, 0)
+            return
+        except TypeError:
+            # Not a displayio.Bitmap
+            pass
+
+    mv, stride = _flat_view(buffer)
+    if mv is not None and row_width <= len(_ZERO_ROW):
+        try:
+            zero = memoryview(_ZERO_ROW)[:row_width]
+            offset = y0 * stride + x0
+            for _ in range(y1 - y0):
+                mv[offset:offset + row_width] = zero
+                offset += stride
+            if hasattr(buffer, 'dirty'):
+                # Raw buffer writes bypass displayio's dirty-area tracking
+                buffer.dirty(x0, y0, x1, y1)
+            return
+        except (TypeError, ValueError, NotImplementedError):
+            # Item size differs from one byte; use pixel writes instead
+            pass
+
+    for y in range(y0, y1):
+        for x in range(x0, x1):
+            buffer[x, y] = 0
+
+class RegionCache:
+    """
+    Off-screen copy of a plugin's drawing.
+
+    The scheduler clears the frame buffer every frame, so a plugin whose
+    output rarely changes still has to repaint it. RegionCache keeps the
+    drawn pixels in a bitmap the size of the panel and restores them with
+    a single blit until invalidate() is called.
+    """
+
+    def __init__(self):
+        self._bitmap = None
+        self._valid = False
+
+    def invalidate(self):
+        """Mark the cached pixels stale; the next render() redraws them"""
+        self._valid = False
+
+    def render(self, buffer, box, draw):
+        """
+        Clear the clamped region box (x0, y0, x1, y1) in buffer, then apply
+        what draw(target) paints in panel coordinates.
+
+        The result matches clearing the region and calling draw(buffer)
+        directly, which is what happens when bitmaptools is unavailable:
+        pixels drawn outside the region are kept, not clipped. Otherwise
+        draw runs on the cache bitmap only after invalidate(), and its lit
+        pixels are blitted over the frame.
+        """
+        clear_region(buffer, *box)
+
+        if bitmaptools is None or not hasattr(buffer, 'width'):
+            draw(buffer)
+            return
+
+        bitmap = self._bitmap
+        if bitmap is None or bitmap.width != buffer.width or bitmap.height != buffer.height:
+            bitmap = self._bitmap = displayio.Bitmap(buffer.width, buffer.height, 256)
+            self._valid = False
+
+        if not self._valid:
+            bitmap.fill(0)
+            draw(bitmap)
+            self._valid = True
+
+        # Color 0 is background, so unlit cache pixels leave the frame untouched
+        bitmaptools.blit(buffer, bitmap, 0, 0, skip_source_index=0)
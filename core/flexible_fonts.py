@@ -4,11 +4,16 @@ Supports multiple font files, dynamic sizing, and smart text fitting
 """
 from . import fonts
 
+# Number of fitted layouts kept; covers every text drawn in one frame
+LAYOUT_CACHE_SIZE = 8
+
 class FontManager:
     """Manages multiple fonts and provides smart text fitting"""
     
     def __init__(self):
         self.fonts = {}
+        self._layout_cache = {}
+        self._layout_order = []  # Cache keys, oldest first
         self._load_fonts()
     
     def _load_fonts(self):
@@ -22,7 +27,22 @@ class FontManager:
     def get_best_font_for_text(self, text, max_width, max_height, max_lines=1, word_wrap=True):
         """
         Find the best font size to fit text in the given constraints.
+        
+        Plugins redraw the same strings every frame, so recent layouts are
+        memoized and only recomputed when the text or its box changes.
         """
+        key = (text, max_width, max_height, max_lines, word_wrap)
+        layout = self._layout_cache.get(key)
+        if layout is None:
+            layout = self._fit_text(text, max_width, max_height, max_lines, word_wrap)
+            if len(self._layout_order) >= LAYOUT_CACHE_SIZE:
+                del self._layout_cache[self._layout_order.pop(0)]
+            self._layout_cache[key] = layout
+            self._layout_order.append(key)
+        return layout
+
+    def _fit_text(self, text, max_width, max_height, max_lines, word_wrap):
+        """Try each font from largest to smallest and return the first layout that fits"""
         font_priority = ['large', 'tiny']
         
         for font_name in font_priority:
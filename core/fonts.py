@@ -170,6 +170,34 @@ FONT_3x5 = {
     '-':[[0,0,0],[0,0,0],[1,1,1],[0,0,0],[0,0,0]],
 }}
 
+# --- Packed Glyphs ---
+
+def _pack_glyphs(font):
+    """
+    Precompute each glyph as (width, height, row bitmasks, pixel offsets).
+
+    Row bitmasks have bit n set for column n. Pixel offsets hold one byte per
+    set pixel, (dy << 4) | dx, so a glyph that lies fully on the panel is drawn
+    by walking only its lit pixels.
+    """
+    glyphs = {}
+    for char, pattern in font['data'].items():
+        rows = bytearray(len(pattern))
+        offsets = bytearray()
+        for row_idx, row in enumerate(pattern):
+            mask = 0
+            for col_idx, pixel in enumerate(row):
+                if pixel:
+                    mask |= 1 << col_idx
+                    offsets.append((row_idx << 4) | col_idx)
+            rows[row_idx] = mask
+        width = len(pattern[0]) if pattern and pattern[0] else 0
+        glyphs[char] = (width, len(pattern), bytes(rows), bytes(offsets))
+    font['glyphs'] = glyphs
+
+for _font in (FONT_5x7, FONT_4x6, FONT_3x5):
+    _pack_glyphs(_font)
+
 # --- Drawing Functions ---
 
 def draw_text(buffer, text, x, y, color, font, max_width=None):
@@ -178,13 +206,13 @@ def draw_text(buffer, text, x, y, color, font, max_width=None):
     """
     x_pos = x
     char_spacing = font['spacing']
+    glyphs = font['glyphs']
     
     for char in text.upper():
-        if char not in font['data']:
+        if char not in glyphs:
             char = '?'
 
-        pattern = font['data'][char]
-        char_width = len(pattern[0]) if pattern and pattern[0] else 0
+        char_width = glyphs[char][0]
 
         if max_width and (x_pos + char_width) > (x + max_width):
             break
@@ -200,18 +228,25 @@ def draw_char(buffer, char, x, y, color, font):
     """
     Draw a single character using a specified bitmap font.
     """
-    if char not in font['data']:
-        char = '?'
+    glyphs = font['glyphs']
+    glyph = glyphs.get(char) or glyphs['?']
     
-    pattern = font['data'][char]
+    if 0 <= x and x + glyph[0] <= 64 and 0 <= y and y + glyph[1] <= 64:
+        # Fully on the panel: write the lit pixels without bounds checks
+        for offset in glyph[3]:
+            buffer[x + (offset & 15), y + (offset >> 4)] = color
+        return
     
-    for row_idx, row in enumerate(pattern):
-        for col_idx, pixel in enumerate(row):
-            pixel_x = x + col_idx
-            pixel_y = y + row_idx
-            
-            if pixel and 0 <= pixel_x < 64 and 0 <= pixel_y < 64:
+    pixel_y = y
+    for row in glyph[2]:
+        # Shift through the row mask; stops after the last set column
+        pixel_x = x
+        while row:
+            if row & 1 and 0 <= pixel_x < 64 and 0 <= pixel_y < 64:
                 buffer[pixel_x, pixel_y] = color
+            row >>= 1
+            pixel_x += 1
+        pixel_y += 1
 
 def get_text_width(text, font):
     """Get the width in pixels that text would occupy with a given font."""
@@ -236,3 +271,21 @@ def truncate_text(text, max_width, font):
         return text[:chars_per_width - 3] + "..."
     else:
         return text[:chars_per_width]
+
+# Typographic characters common in feed titles and their closest ASCII form
+_ASCII_SUBSTITUTES = {
+    '\u00a0': ' ',
+    '\u2013': '-', '\u2014': '-', '\u2212': '-',
+    '\u2018': "'", '\u2019': "'", '\u201a': "'", '\u2032': "'",
+    '\u201c': '"', '\u201d': '"', '\u201e': '"', '\u2033': '"',
+    '\u2026': '...',
+}
+
+def to_ascii(text):
+    """
+    Replace non-ASCII characters with their closest ASCII form, or '?'.
+    Meant to run once when text is fetched rather than on every draw.
+    """
+    if len(text.encode()) == len(text):
+        return text
+    return ''.join(char if ord(char) < 128 else _ASCII_SUBSTITUTES.get(char, '?') for char in text)
@@ -0,0 +1,82 @@
+"""
+Headline rotation for MatrixPortal S3 Dashboard
+Shared base for plugins that show one headline at a time
+"""
+import time
+try:
+    from micropython import const
+except ImportError:
+    def const(value):
+        return value
+from .plugin_interface import PluginInterface
+try:
+    from .flexible_fonts import fit_and_draw_text
+    FLEXIBLE_FONTS = True
+except ImportError:
+    from .fonts import draw_text, FONT_3x5
+    FLEXIBLE_FONTS = False
+    print("Using fallback fonts for headlines")
+
+# Palette index for the headline
+_WHITE = const(7)
+
+class HeadlinePlugin(PluginInterface):
+    """
+    Shows one headline in the plugin region, moving to the next one every
+    few minutes.
+
+    Subclasses set ROTATION_KEY to the config key holding the rotation
+    interval in minutes and implement _current_title().
+    """
+
+    ROTATION_KEY = None
+
+    def __init__(self, config):
+        super().__init__(config)
+        self._last_change_ns = 0
+        self._rotation_ns = self._rotation_interval_ns()
+
+    def _rotation_interval_ns(self):
+        """Rotation interval from config as integer nanoseconds"""
+        return int(self.config.get(self.ROTATION_KEY, 5) * 60 * 1_000_000_000)
+
+    def update_config(self, new_config):
+        super().update_config(new_config)
+        self._rotation_ns = self._rotation_interval_ns()
+
+    def _rotation_due(self):
+        """True once the shown headline has been up for the rotation interval"""
+        return time.monotonic_ns() - self._last_change_ns >= self._rotation_ns
+
+    def _headline_changed(self, rotated=False):
+        """Redraw after the shown headline changes; rotated restarts its interval"""
+        if rotated:
+            self._last_change_ns = time.monotonic_ns()
+        self._region_cache.invalidate()
+
+    def _current_title(self):
+        """Title of the shown headline - must be implemented by subclasses"""
+        raise NotImplementedError("Subclasses must implement _current_title")
+
+    def _draw_title(self, target):
+        """Draw the current title into target in panel coordinates"""
+        region_x, region_y, region_width, region_height = self._geom
+        # Small margins around the title
+        title_x = region_x + 2
+        title_y = region_y + 1
+        title = self._current_title()
+
+        if FLEXIBLE_FONTS:
+            # Use all available height, with configurable word wrap
+            word_wrap = self.config.get("word_wrap", True)
+            fit_and_draw_text(target, title,
+                             title_x, title_y,
+                             region_width - 4, region_height - 2, _WHITE, max_lines=99, word_wrap=word_wrap)
+        else:
+            # Fallback to simple font
+            title_short = title[:12] + "..." if len(title) > 12 else title
+            draw_text(target, title_short, title_x, title_y + 1, _WHITE, FONT_3x5)
+
+    def _render_title(self, display_buffer, width, height):
+        """Copy the current title into display_buffer, drawing it first if it changed"""
+        self.render_cached(display_buffer, width, height, self._draw_title, 48, 16)
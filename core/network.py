@@ -7,6 +7,19 @@ import socketpool
 import ssl
 import time
 import asyncio
+import json
+# Prefer a C JSON parser that takes bytes directly when one is installed;
+# CircuitPython has neither and keeps streaming through response.json()
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    try:
+        from ujson import loads as _json_loads
+    except ImportError:
+        _json_loads = None
+# The first json call on CircuitPython pays one-off setup cost; take it at
+# import rather than inside the first response parse
+json.dumps(None)
 try:
     import watchdog
     WATCHDOG_AVAILABLE = True
@@ -14,9 +27,46 @@ except ImportError:
     WATCHDOG_AVAILABLE = False
     print("Watchdog not available on this platform")
 
+def _parse_json(response):
+    """Decode a JSON response body, using the fast loader if available"""
+    if _json_loads:
+        return _json_loads(response.content)
+    return response.json()
+
+def _parse_array_prefix(response, limit):
+    """
+    Decode the first `limit` items of a flat JSON array of scalars (no
+    nesting or strings containing commas), reading no further than needed
+    """
+    if limit <= 0:
+        return []
+    buf = bytearray()
+    commas = 0
+    truncated = False
+    for chunk in response.iter_content(chunk_size=256):
+        found = chunk.count(b',')
+        if commas + found < limit:
+            buf.extend(chunk)
+            commas += found
+            continue
+        # The limit-th comma ends the last wanted item
+        pos = -1
+        for _ in range(limit - commas):
+            pos = chunk.find(b',', pos + 1)
+        buf.extend(chunk[:pos])
+        truncated = True
+        break
+    if truncated:
+        buf.extend(b']')
+    loads = _json_loads or json.loads
+    return loads(bytes(buf))
+
 class NetworkManager:
     """Manages Wi-Fi connectivity and network operations"""
     
+    # Returned by conditional fetches when the server replies 304 Not Modified
+    NOT_MODIFIED = object()
+    
     def __init__(self, config):
         self.config = config
         self.ssid = config.get('ssid', '')
@@ -38,6 +88,9 @@ class NetworkManager:
         self.socket_pool = None
         self.ssl_context = None
         
+        # Cache validators per URL for conditional fetches: url -> (etag, last_modified)
+        self._validators = {}
+        
         # Watchdog configuration
         self.watchdog_enabled = config.get('watchdog_enabled', True)
         self.watchdog_timeout = config.get('watchdog_timeout', 120)  # 2 minutes
@@ -453,8 +506,54 @@ class NetworkManager:
         
         return False
     
-    async def fetch_json(self, url, timeout=30):
-        """Fetch JSON data from a URL with retry for EINPROGRESS"""
+    async def fetch_json(self, url, timeout=30, conditional=False):
+        """
+        Fetch JSON data from a URL with retry for EINPROGRESS.
+        With conditional=True, returns NOT_MODIFIED if the body is unchanged
+        since the last fetch of url.
+        """
+        return await self._fetch(url, timeout, _parse_json, conditional)
+    
+    async def fetch_json_prefix_array(self, url, limit, timeout=30):
+        """Fetch only the first `limit` items of a flat JSON array (e.g. a list of IDs)"""
+        return await self._fetch(url, timeout, lambda response: _parse_array_prefix(response, limit))
+    
+    async def fetch_text(self, url, timeout=30, conditional=False):
+        """
+        Fetch a text body (RSS, plain-text APIs) from a URL with retry for EINPROGRESS.
+        With conditional=True, returns NOT_MODIFIED if the body is unchanged
+        since the last fetch of url.
+        """
+        return await self._fetch(url, timeout, lambda response: response.text, conditional)
+    
+    def _conditional_headers(self, url):
+        """Request headers that let the server answer 304 for an unchanged url"""
+        etag, last_modified = self._validators.get(url, (None, None))
+        if etag:
+            return {"If-None-Match": etag}
+        if last_modified:
+            return {"If-Modified-Since": last_modified}
+        return None
+    
+    def _store_validators(self, url, response):
+        """Remember the ETag / Last-Modified of a 200 reply for the next conditional fetch"""
+        etag = last_modified = None
+        for name, value in response.headers.items():
+            name = name.lower()
+            if name == "etag":
+                etag = value
+            elif name == "last-modified":
+                last_modified = value
+        if etag or last_modified:
+            self._validators[url] = (etag, last_modified)
+        else:
+            self._validators.pop(url, None)
+    
+    async def _fetch(self, url, timeout, parse, conditional=False):
+        """
+        GET a URL and return parse(response) for a 200 reply, NOT_MODIFIED for
+        a 304 reply to a conditional fetch, None otherwise
+        """
         if not self.is_connected() or not self.socket_pool:
             return None
             
@@ -463,12 +562,18 @@ class NetworkManager:
         
         for attempt in range(3): # Try up to 3 times
             try:
-                response = requests.get(url, timeout=timeout)
+                headers = self._conditional_headers(url) if conditional else None
+                response = requests.get(url, headers=headers, timeout=timeout)
                 
                 if response.status_code == 200:
-                    data = response.json()
+                    data = parse(response)
+                    if conditional:
+                        self._store_validators(url, response)
                     response.close()
                     return data
+                elif response.status_code == 304 and conditional:
+                    response.close()
+                    return self.NOT_MODIFIED
                 else:
                     print(f"HTTP error {response.status_code} for {url}")
                     response.close()
@@ -3,6 +3,8 @@ Plugin interface specification for MatrixPortal S3 Dashboard
 Defines the standard interface that all plugins must implement
 """
 import asyncio
+import time
+from .drawing import RegionCache
 
 class PluginMetadata:
     """Plugin metadata container"""
@@ -26,7 +28,68 @@ class PluginInterface:
         self.data = {}
         self.error_count = 0
         self.network = None
+        self._screen_config = {}
+        self._geom = None
+        self._clear_box = None  # _geom clamped to the panel as (x0, y0, x1, y1)
+        self._region_cache = RegionCache()  # see render_cached
+        self._backoff = 0  # seconds, 0 while pulls are healthy
+        self._next_pull_ok = 0
         
+    @property
+    def screen_config(self):
+        """Layout info (x, y, width, height, ...) assigned by the screen manager"""
+        return self._screen_config
+    
+    @screen_config.setter
+    def screen_config(self, value):
+        self._screen_config = value
+        self._invalidate_layout()
+    
+    def _invalidate_layout(self):
+        """Drop cached layout values; called whenever screen_config is reassigned"""
+        self._geom = None
+        self._clear_box = None
+        self._region_cache.invalidate()
+    
+    def get_region(self, width, height, default_y=0, default_height=None):
+        """
+        Get the plugin's drawing region as (x, y, width, height)
+        
+        Resolved from screen_config on first use and cached until
+        screen_config is reassigned, so render() avoids per-frame lookups.
+        The region clamped to the panel is cached alongside as _clear_box.
+        """
+        geom = self._geom
+        if geom is None:
+            sc = self._screen_config
+            geom = self._geom = (
+                sc.get('x', 0),
+                sc.get('y', default_y),
+                sc.get('width', width),
+                sc.get('height', height if default_height is None else default_height)
+            )
+            x, y, w, h = geom
+            self._clear_box = (x, y, min(x + w, width), min(y + h, height))
+        return geom
+    
+    def render_cached(self, display_buffer, width, height, draw, default_y=0, default_height=None):
+        """
+        Copy the plugin's region into display_buffer from the region cache
+        
+        draw(target) paints the region in panel coordinates; it runs only
+        after the cache is invalidated, and each frame is then restored with
+        a single blit. The cache is invalidated on screen_config and config
+        changes; plugins also invalidate it when their data changes.
+
+        The region is cleared first, but drawing is not clipped to it: pixels
+        drawn past the region's edges are kept up to the panel edges, the same
+        as drawing straight into display_buffer. This holds with and without
+        bitmaptools.
+        """
+        if self._geom is None:
+            self.get_region(width, height, default_y, default_height)
+        self._region_cache.render(display_buffer, self._clear_box, draw)
+    
     @property
     def metadata(self):
         """Return plugin metadata - must be implemented by subclasses"""
@@ -56,6 +119,21 @@ class PluginInterface:
             raise NotImplementedError("Pull method must be implemented for pull-type plugins")
         return {}
     
+    def _pull_backoff_active(self):
+        """True while a recent pull failure is still backing off"""
+        return time.monotonic() < self._next_pull_ok
+    
+    def _pull_failed(self):
+        """Skip pulls for an exponentially growing delay (60s doubling up to 1h)"""
+        self._backoff = min(self._backoff * 2 or 60, 3600)
+        self._next_pull_ok = time.monotonic() + self._backoff
+        print(f"{self.metadata.name}: backing off pulls for {self._backoff}s")
+    
+    def _pull_succeeded(self):
+        """Reset the pull backoff after a good fetch"""
+        self._backoff = 0
+        self._next_pull_ok = 0
+    
     def push_callback(self, topic, payload):
         """
         Handle pushed data (for push-type plugins)
@@ -92,6 +170,8 @@ class PluginInterface:
         """Update plugin configuration"""
         self.config.update(new_config)
         self.enabled = self.config.get("enabled", True)
+        # Drawn output may depend on any config value
+        self._region_cache.invalidate()
 
 class PluginManager:
     """Manages plugin lifecycle and discovery"""
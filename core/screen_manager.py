@@ -5,6 +5,7 @@ Manages display groups/screens that can contain multiple plugins
 import asyncio
 import time
 import gc
+from .drawing import clear_region
 
 class ScreenLayout:
     """Defines a screen layout with multiple plugin regions"""
@@ -172,9 +173,7 @@ class ScreenManager:
         
         try:
             # Clear the entire buffer first
-            for y in range(height):
-                for x in range(width):
-                    display_buffer[x, y] = 0
+            clear_region(display_buffer, 0, 0, width, height)
             
             # Render each plugin in the screen
             rendered_any = False
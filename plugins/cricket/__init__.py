@@ -1,14 +1,22 @@
 import time
-import adafruit_requests
+try:
+    from micropython import const
+except ImportError:
+    def const(value):
+        return value
 from core.plugin_interface import PluginInterface, PluginMetadata
 try:
     from core.flexible_fonts import fit_and_draw_text
     FLEXIBLE_FONTS = True
 except ImportError:
-    from core.fonts import draw_text
+    from core.fonts import draw_text, FONT_3x5
     FLEXIBLE_FONTS = False
     print("Using fallback fonts for cricket plugin")
 
+# Palette indices
+_WHITE = const(1)
+_GREEN = const(3)
+
 def _parse_xml(xml_string, tag):
     """A very simple and non-robust XML parser for RSS feeds."""
     results = []
@@ -35,6 +43,8 @@ class Plugin(PluginInterface):
         self.current_headline_index = 0
         self.last_headline_change_time = 0
         self.display_mode = "news" # Default to news
+        self._shown_text = ""  # text and color last drawn into the region cache
+        self._shown_color = _GREEN
 
     @property
     def metadata(self):
@@ -57,19 +67,17 @@ class Plugin(PluginInterface):
         rss_url = self.config.get("rss_url")
         if not self.network or not self.network.is_connected() or not rss_url:
             return None
+        if self._pull_backoff_active():
+            return None
 
         try:
-            requests = adafruit_requests.Session(self.network.get_socket_pool(), self.network.get_ssl_context())
-            response = requests.get(rss_url, timeout=10)
+            xml_text = await self.network.fetch_text(rss_url, timeout=10)
             
-            if response.status_code != 200:
-                print(f"Cricket RSS fetch error: Status {response.status_code}")
+            if not xml_text:
+                print("Cricket RSS fetch error")
                 self.headlines = ["RSS Fetch Error"]
-                response.close()
-                return
-
-            xml_text = response.text
-            response.close()
+                self._pull_failed()
+                return None
             
             # First, get all <item> blocks, then get the <title> from each.
             # This correctly ignores the main <channel> title.
@@ -82,6 +90,8 @@ class Plugin(PluginInterface):
 
             team_name = self.config.get("team", "India").lower()
             
+            self._pull_succeeded()
+            
             # Look for a live score in the titles
             for title in titles:
                 if " vs " in title.lower() and "/" in title and team_name in title.lower():
@@ -102,26 +112,28 @@ class Plugin(PluginInterface):
         except Exception as e:
             print(f"Cricket plugin RSS fetch error: {e}")
             self.headlines = ["RSS Parse Error"]
+            self._pull_failed()
             return None
 
     def _format_score_title(self, title):
         # A simple formatter, might need adjustment based on actual titles
         return title.replace(" - Live Cricket Score", "")
 
-    def render(self, display_buffer, width, height):
-        screen_config = getattr(self, 'screen_config', {})
-        region_x, region_y = screen_config.get('x', 0), screen_config.get('y', 0)
-        region_width, region_height = screen_config.get('width', width), screen_config.get('height', height)
-        
-        white, green = 1, 3
-        
-        # Clear the plugin's region before drawing
-        for y in range(region_y, min(region_y + region_height, height)):
-            for x in range(region_x, min(region_x + region_width, width)):
-                display_buffer[x, y] = 0
+    def _draw_text(self, target):
+        """Draw the shown text into target in panel coordinates"""
+        region_x, region_y, region_width, region_height = self._geom
+        if FLEXIBLE_FONTS:
+            word_wrap = self.config.get("word_wrap", True)
+            fit_and_draw_text(target, self._shown_text, 
+                             region_x + 1, region_y + 1,
+                             region_width - 2, region_height - 2, 
+                             self._shown_color, max_lines=4, word_wrap=word_wrap)
+        else:
+            draw_text(target, self._shown_text[:24], region_x + 2, region_y + 2, self._shown_color, FONT_3x5)
 
+    def render(self, display_buffer, width, height):
         text_to_draw = ""
-        color = green
+        color = _GREEN
 
         if self.display_mode == "live_score" and self.match_data:
             text_to_draw = self.match_data.get("text", "Score Error")
@@ -133,19 +145,16 @@ class Plugin(PluginInterface):
             
             if self.headlines:
                  text_to_draw = self.headlines[self.current_headline_index]
-            color = white
+            color = _WHITE
 
         if not text_to_draw:
             return False
 
-        if FLEXIBLE_FONTS:
-            word_wrap = self.config.get("word_wrap", True)
-            fit_and_draw_text(display_buffer, text_to_draw, 
-                             region_x + 1, region_y + 1,
-                             region_width - 2, region_height - 2, 
-                             color, max_lines=4, word_wrap=word_wrap)
-        else:
-            draw_text(display_buffer, text_to_draw[:24], region_x + 2, region_y + 2, color)
+        # The text changes only on pull or headline rotation
+        if text_to_draw != self._shown_text or color != self._shown_color:
+            self._shown_text = text_to_draw
+            self._shown_color = color
+            self._region_cache.invalidate()
+        self.render_cached(display_buffer, width, height, self._draw_text)
 
         return True
-
@@ -1,4 +1,9 @@
 import time
+try:
+    from micropython import const
+except ImportError:
+    def const(value):
+        return value
 from core.plugin_interface import PluginInterface, PluginMetadata
 try:
     from core.flexible_fonts import fit_and_draw_text
@@ -8,11 +13,17 @@ except ImportError:
     FLEXIBLE_FONTS = False
     print("Using fallback fonts for f1 plugin")
 
+# Palette indices
+_WHITE = const(7)
+_RED = const(2)
+
 class Plugin(PluginInterface):
     def __init__(self, config):
         super().__init__(config)
         self.network = None
         self.f1_data = None
+        self._lines = ()  # (text, y offset, color) per rendered line
+        self._drawn_lines = None  # _lines as last drawn into the region cache
 
     @property
     def metadata(self):
@@ -28,6 +39,8 @@ class Plugin(PluginInterface):
     async def pull(self):
         if not self.network or not self.network.is_connected():
             return None
+        if self._pull_backoff_active():
+            return self.f1_data
 
         try:
             latest_session_url = "https://api.openf1.org/v1/sessions?session_key=latest"
@@ -35,6 +48,8 @@ class Plugin(PluginInterface):
             
             if not latest_session_resp:
                 self.f1_data = {"text": "No F1 Data"}
+                self._lines = ()
+                self._pull_failed()
                 return self.f1_data
 
             session = latest_session_resp[0]
@@ -45,23 +60,34 @@ class Plugin(PluginInterface):
             drivers_resp = await self.network.fetch_json(drivers_url)
             driver_map = {d['driver_number']: d['full_name'] for d in drivers_resp} if drivers_resp else {}
 
-            pos_url = f"https://api.openf1.org/v1/position?session_key={session_key}"
+            # Only the top positions are rendered, so ask the API for just those
+            # rows instead of the whole session's position history
+            show_top = self.config.get('show_top', 3)
+            pos_url = f"https://api.openf1.org/v1/position?session_key={session_key}&position<={show_top}"
             pos_response = await self.network.fetch_json(pos_url)
             
             if pos_response:
-                # Correctly find the latest position for each driver
+                # Rows are ordered by date and one is emitted for every position change,
+                # so the newest row for each position is its current holder. Scan from
+                # the end and stop as soon as every shown position has been seen.
                 latest_positions = {}
-                for entry in pos_response:
-                    driver_number = entry.get('driver_number')
-                    if driver_number:
-                        # Since the data is ordered by date, the last entry for a driver is the latest
-                        latest_positions[driver_number] = entry
-                
-                # Convert dict values to a list and sort by position
-                final_standings = sorted(latest_positions.values(), key=lambda x: x.get('position', 99))
-                
+                for i in range(len(pos_response) - 1, -1, -1):
+                    entry = pos_response[i]
+                    position = entry.get('position')
+                    if position and position not in latest_positions:
+                        latest_positions[position] = entry
+                        if len(latest_positions) >= show_top:
+                            break
+                final_standings = [latest_positions[p] for p in sorted(latest_positions)]
+            else:
+                # Fall back to the full position history for the session
+                pos_url = f"https://api.openf1.org/v1/position?session_key={session_key}"
+                pos_response = await self.network.fetch_json(pos_url)
+                final_standings = self._standings_from_history(pos_response) if pos_response else []
+            
+            if final_standings:
                 top_drivers = []
-                for p in final_standings[:self.config.get('show_top', 3)]:
+                for p in final_standings[:show_top]:
                     driver_num = p.get('driver_number')
                     driver_name = driver_map.get(driver_num, f"Driver {driver_num}")
                     last_name = driver_name.split(' ')[-1] if ' ' in driver_name else driver_name
@@ -71,39 +97,56 @@ class Plugin(PluginInterface):
             else:
                 self.f1_data = {"name": race_name, "results": ["Completed"]}
 
+            self._build_lines()
+            self._pull_succeeded()
             return self.f1_data
 
         except Exception as e:
             print(f"F1 plugin fetch error: {e}")
             self.f1_data = {"text": "F1 API Error"}
+            self._lines = ()
+            self._pull_failed()
             return self.f1_data
 
-    def render(self, display_buffer, width, height):
-        if not self.f1_data or not self.f1_data.get('results'):
-            return False
+    def _build_lines(self):
+        """Lay out the header and result lines once per pull instead of per frame"""
+        lines = [(self.f1_data.get('name', 'F1'), 1, _RED)]
+        line_y = 10
+        for driver_text in self.f1_data['results']:
+            lines.append((driver_text, line_y, _WHITE))
+            line_y += 8
+        self._lines = tuple(lines)
 
-        screen_config = getattr(self, 'screen_config', {})
-        region_x, region_y = screen_config.get('x', 0), screen_config.get('y', 0)
-        region_width, region_height = screen_config.get('width', width), screen_config.get('height', height)
-        
-        white = 7
-        red = 2
+    def _standings_from_history(self, pos_response):
+        """Reduce a full position history to the latest standing of each driver"""
+        latest_positions = {}
+        for entry in pos_response:
+            driver_number = entry.get('driver_number')
+            if driver_number:
+                # Since the data is ordered by date, the last entry for a driver is the latest
+                latest_positions[driver_number] = entry
         
-        for y in range(region_y, min(region_y + region_height, height)):
-            for x in range(region_x, min(region_x + region_width, width)):
-                display_buffer[x, y] = 0
+        # Convert dict values to a list and sort by position
+        return sorted(latest_positions.values(), key=lambda x: x.get('position', 99))
 
-        fit_and_draw_text(display_buffer, self.f1_data.get('name', 'F1'), 
-                         region_x + 2, region_y + 1, 
-                         region_width - 4, 7, red, 1)
-        
-        line_y = region_y + 10
-        for driver_text in self.f1_data['results']:
-            if line_y >= region_y + region_height:
+    def _draw_lines(self, target):
+        """Draw the header and result lines into target in panel coordinates"""
+        region_x, region_y, region_width, region_height = self._geom
+        for text, line_y, color in self._lines:
+            if line_y >= region_height:
                 break
-            fit_and_draw_text(display_buffer, driver_text, 
-                             region_x + 2, line_y, 
-                             region_width - 4, 7, white, 1)
-            line_y += 8
+            fit_and_draw_text(target, text, 
+                             region_x + 2, region_y + line_y, 
+                             region_width - 4, 7, color, 1)
+
+    def render(self, display_buffer, width, height):
+        if not self._lines:
+            return False
+
+        # Lines are only rebuilt on pull
+        if self._lines is not self._drawn_lines:
+            self._drawn_lines = self._lines
+            self._region_cache.invalidate()
+        self.render_cached(display_buffer, width, height, self._draw_lines)
 
-        return True
\ No newline at end of file
+        return True
@@ -1,23 +1,25 @@
-import json
 import gc
 import time
-from core.plugin_interface import PluginInterface, PluginMetadata
-try:
-    from core.flexible_fonts import fit_and_draw_text
-    FLEXIBLE_FONTS = True
-except:
-    from core.fonts import draw_text
-    FLEXIBLE_FONTS = False
-    print("Using fallback fonts for hackernews")
+from array import array
+from core.plugin_interface import PluginMetadata
+from core.headlines import HeadlinePlugin
+from core.fonts import to_ascii
 
-class Plugin(PluginInterface):
+# Seconds a fetched item is reused across refreshes before it is re-fetched
+_ITEM_TTL = 6 * 3600
+
+class Plugin(HeadlinePlugin):
+    ROTATION_KEY = "story_rotation_minutes"
+    
     def __init__(self, config):
         super().__init__(config)
         self.network = None  # Will be set by plugin manager
-        self.stories = []
-        self.current_story = None
-        self.last_story_change = 0
+        # Stories are kept as parallel arrays in ranking order
+        self._ids = array('i')
+        self._titles = []
+        self._cur_idx = -1  # index of the shown story, -1 when none
         self.last_fetch = 0
+        self._item_cache = {}  # story id -> (title, fetch time)
         
     @property
     def metadata(self):
@@ -38,134 +40,151 @@ class Plugin(PluginInterface):
         )
     
     async def pull(self):
-        """Fetch top stories from Hacker News API"""
+        """Fetch top stories from Hacker News"""
         if not self.network or not self.network.is_connected():
             return None
             
         try:
-            # Fetch top story IDs
-            top_stories_url = "https://hacker-news.firebaseio.com/v0/topstories.json"
-            story_ids = await self.network.fetch_json(top_stories_url)
-            
-            if not story_ids:
-                return None
-            
-            # Get the first N stories (default 50)
-            max_stories = self.config.get("max_stories", 50)
-            selected_ids = story_ids[:max_stories]
-            
-            # Fetch story details for each ID
-            stories = []
-            for story_id in selected_ids[:10]:  # Limit to first 10 for memory
-                try:
-                    story_url = f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json"
-                    story_data = await self.network.fetch_json(story_url)
-                    
-                    if story_data and story_data.get("title"):
-                        stories.append({
-                            "id": story_id,
-                            "title": story_data["title"],
-                            "url": story_data.get("url", f"https://news.ycombinator.com/item?id={story_id}"),
-                            "score": story_data.get("score", 0),
-                            "by": story_data.get("by", "unknown")
-                        })
-                        
-                    # Yield control occasionally to prevent blocking
-                    if len(stories) % 3 == 0:
-                        gc.collect()
-                        
-                except Exception as e:
-                    print(f"Error fetching story {story_id}: {e}")
-                    continue
+            # One Algolia request carries every title; fall back to the
+            # per-item Firebase API if it is unavailable
+            try:
+                stories = await self._fetch_front_page()
+            except Exception as e:
+                print(f"HackerNews front page error: {e}")
+                stories = None
+            if not stories:
+                stories = await self._fetch_top_stories()
             
             if stories:
-                self.stories = stories
+                self._ids, self._titles = stories
                 self.last_fetch = time.monotonic()
-                # Set initial story if none selected
-                if not self.current_story:
-                    self._select_random_story()
-                return {"stories_count": len(stories)}
+                # Set initial story if none selected; otherwise the slot may now hold another title
+                if not 0 <= self._cur_idx < len(self._titles):
+                    self._select_next_story()
+                else:
+                    self._headline_changed()
+                return {"stories_count": len(self._titles)}
                 
         except Exception as e:
             print(f"HackerNews fetch error: {e}")
             
         return None
     
-    def _select_random_story(self):
-        """Select a random story from the fetched stories"""
-        if not self.stories:
+    async def _fetch_front_page(self):
+        """Fetch front page stories in a single Algolia search request"""
+        count = min(self.config.get("max_stories", 50), 10)  # Limit to first 10 for memory
+        url = f"https://hn.algolia.com/api/v1/search?tags=front_page&hitsPerPage={count}"
+        response = await self.network.fetch_json(url)
+        if not response or not response.get("hits"):
+            return None
+        
+        ids = array('i')
+        titles = []
+        add_id, add_title = ids.append, titles.append
+        # Stories still on the front page keep their already normalised title
+        previous_title = dict(zip(self._ids, self._titles)).get
+        for hit in response["hits"]:
+            title = hit.get("title")
+            if not title:
+                continue
+            try:
+                story_id = int(hit["objectID"])
+            except (KeyError, TypeError, ValueError):
+                # Skip malformed hits rather than dropping the whole page
+                continue
+            add_id(story_id)
+            add_title(previous_title(story_id) or to_ascii(title))
+        return (ids, titles) if titles else None
+    
+    async def _fetch_top_stories(self):
+        """Fetch top story IDs and then each story's details from the Firebase API"""
+        # Fetch only the top story IDs that are shown; the full list has ~500
+        max_stories = self.config.get("max_stories", 50)
+        top_stories_url = "https://hacker-news.firebaseio.com/v0/topstories.json"
+        fetch_ids = await self.network.fetch_json_prefix_array(
+            top_stories_url, min(max_stories, 10))  # Limit to first 10 for memory
+        
+        if not fetch_ids:
+            return None
+        
+        # Reuse items fetched on earlier refreshes that are still fresh
+        now = time.monotonic()
+        item_cache = self._item_cache
+        cache_get = item_cache.get
+        missing_ids = []
+        for story_id in fetch_ids:
+            cached = cache_get(story_id)
+            if not cached or now - cached[1] >= _ITEM_TTL:
+                missing_ids.append(story_id)
+        
+        # Fetch the remaining story details; fetch_json blocks until each reply is read
+        fetch_json = self.network.fetch_json
+        for story_id in missing_ids:
+            try:
+                story_data = await fetch_json(f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json")
+            except Exception as e:
+                print(f"Error fetching story {story_id}: {e}")
+                continue
+            if story_data and story_data.get("title"):
+                # Stored ASCII-only, as the bitmap fonts have no other glyphs
+                item_cache[story_id] = (to_ascii(story_data["title"]), now)
+        
+        # Keep ranking order and evict stories that dropped out of the selection
+        ids = array('i')
+        titles = []
+        add_id, add_title = ids.append, titles.append
+        for story_id in fetch_ids:
+            cached = cache_get(story_id)
+            if cached:
+                add_id(story_id)
+                add_title(cached[0])
+        for story_id in list(item_cache):
+            if story_id not in fetch_ids:
+                del item_cache[story_id]
+        
+        if not titles:
+            return None
+        
+        # Reclaim the parsed item payloads with a single pass once all requests are done
+        gc.collect()
+        
+        return ids, titles
+    
+    def _select_next_story(self):
+        """Advance to the next fetched story, wrapping around"""
+        if not self._titles:
             return
             
-        # Simple pseudo-random selection using current time
-        current_time = time.monotonic()
-        index = int(current_time) % len(self.stories)
-        self.current_story = self.stories[index]
-        self.last_story_change = current_time
+        # A running index visits every story once per cycle, unlike a time-based pick
+        self._cur_idx = (self._cur_idx + 1) % len(self._titles)
+        self._headline_changed(rotated=True)
     
     def _should_change_story(self):
         """Check if it's time to change the current story"""
-        if not self.current_story or not self.stories:
+        if self._cur_idx < 0 or not self._titles:
             return True
             
-        rotation_minutes = self.config.get("story_rotation_minutes", 5)
-        rotation_seconds = rotation_minutes * 60
-        
-        return (time.monotonic() - self.last_story_change) >= rotation_seconds
+        return self._rotation_due()
+    
+    def _current_title(self):
+        return self._titles[self._cur_idx]
     
     def render(self, display_buffer, width, height):
         """Render current Hacker News headline at the bottom"""
-        if not self.stories:
+        if not self._titles:
             return False
             
         # Check if we should change the story
         if self._should_change_story():
-            self._select_random_story()
+            self._select_next_story()
             
-        if not self.current_story:
+        if self._cur_idx < 0:
             return False
             
         try:
-            # Get screen configuration for positioning
-            screen_config = getattr(self, 'screen_config', {})
-            region_x = screen_config.get('x', 0)
-            region_y = screen_config.get('y', 48)
-            region_width = screen_config.get('width', width)
-            region_height = screen_config.get('height', 16)
-            max_title_length = self.config.get("max_title_length", 60)
-            
-            # Colors
-            white = 7
-            orange = 5  # HN orange theme
-            gray = 3
-            
-            # Clear the HN area
-            for y in range(region_y, min(region_y + region_height, height)):
-                for x in range(region_x, min(region_x + region_width, width)):
-                    display_buffer[x, y] = 0
-            
-            # Prepare title text
-            title = self.current_story["title"]
-            
-            # Use most of the region for the title (3 lines max)
-            title_area_width = region_width - 4  # Small margin
-            title_area_height = region_height - 2  # Small margin
-            
-            if FLEXIBLE_FONTS:
-                # Render title, using configurable word wrap and all available height
-                word_wrap = self.config.get("word_wrap", True)
-                fit_and_draw_text(display_buffer, title, 
-                                 region_x + 2, region_y + 1,
-                                 title_area_width, title_area_height, white, max_lines=99, word_wrap=word_wrap)
-            else:
-                # Fallback to simple font
-                # Truncate title for fallback
-                title_short = title[:12] + "..." if len(title) > 12 else title
-                draw_text(display_buffer, title_short, region_x + 2, region_y + 2, white)
-            
+            self._render_title(display_buffer, width, height)
             return True
             
         except Exception as e:
             print(f"HackerNews render error: {e}")
             return False
-    
-
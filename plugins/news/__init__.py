@@ -1,22 +1,19 @@
-import json
 import gc
 import time
-from core.plugin_interface import PluginInterface, PluginMetadata
-try:
-    from core.flexible_fonts import fit_and_draw_text
-    FLEXIBLE_FONTS = True
-except:
-    from core.fonts import draw_text
-    FLEXIBLE_FONTS = False
-    print("Using fallback fonts for news plugin")
+from core.plugin_interface import PluginMetadata
+from core.headlines import HeadlinePlugin
+from core.fonts import to_ascii
 
-class Plugin(PluginInterface):
+class Plugin(HeadlinePlugin):
+    ROTATION_KEY = "article_rotation_minutes"
+    
     def __init__(self, config):
         super().__init__(config)
         self.network = None  # Will be set by plugin manager
         self.articles = []
         self.current_article = None
-        self.last_article_change = 0
+        self._by_feed_title = {}  # title as received -> article entry, from the last refresh
+        self._rot_idx = -1  # index of current_article in articles
         self.last_fetch = 0
         
     @property
@@ -56,17 +53,29 @@ class Plugin(PluginInterface):
             
             max_articles = self.config.get("max_articles", 25)
             
-            # Extract titles from the articles
-            self.articles = [
-                {"title": item.get("title", "No Title")}
-                for item in response['items'][:max_articles] if item.get("title")
-            ]
+            # Extract titles from the articles, reusing the entry of any article
+            # that was already in the feed on the last refresh
+            previous = self._by_feed_title
+            by_feed_title = {}
+            articles = []
+            add_article = articles.append
+            for item in response['items'][:max_articles]:
+                title = item.get("title")
+                if title:
+                    article = previous.get(title)
+                    if article is None:
+                        # Normalise once here so drawing only meets characters the fonts have
+                        article = {"title": to_ascii(title)}
+                    by_feed_title[title] = article
+                    add_article(article)
+            self.articles = articles
+            self._by_feed_title = by_feed_title
             
             if self.articles:
                 self.last_fetch = time.monotonic()
                 # Set initial article if none selected
                 if not self.current_article:
-                    self._select_random_article()
+                    self._select_next_article()
                 return {"articles_count": len(self.articles)}
                 
         except Exception as e:
@@ -74,25 +83,25 @@ class Plugin(PluginInterface):
             
         return None
     
-    def _select_random_article(self):
-        """Select a random article from the fetched articles."""
+    def _select_next_article(self):
+        """Advance to the next fetched article, wrapping around."""
         if not self.articles:
             return
             
-        current_time = time.monotonic()
-        index = int(current_time) % len(self.articles)
-        self.current_article = self.articles[index]
-        self.last_article_change = current_time
+        # A running index visits every article once per cycle, unlike a time-based pick
+        self._rot_idx = (self._rot_idx + 1) % len(self.articles)
+        self.current_article = self.articles[self._rot_idx]
+        self._headline_changed(rotated=True)
     
     def _should_change_article(self):
         """Check if it's time to change the current article."""
         if not self.current_article or not self.articles:
             return True
             
-        rotation_minutes = self.config.get("article_rotation_minutes", 5)
-        rotation_seconds = rotation_minutes * 60
-        
-        return (time.monotonic() - self.last_article_change) >= rotation_seconds
+        return self._rotation_due()
+    
+    def _current_title(self):
+        return self.current_article["title"]
     
     def render(self, display_buffer, width, height):
         """Render the current news headline."""
@@ -100,43 +109,13 @@ class Plugin(PluginInterface):
             return False
             
         if self._should_change_article():
-            self._select_random_article()
+            self._select_next_article()
             
         if not self.current_article:
             return False
             
         try:
-            screen_config = getattr(self, 'screen_config', {})
-            region_x = screen_config.get('x', 0)
-            region_y = screen_config.get('y', 48)
-            region_width = screen_config.get('width', width)
-            region_height = screen_config.get('height', 16)
-            
-            # Colors
-            white = 7
-            blue = 4
-            
-            # Clear the news area
-            for y in range(region_y, min(region_y + region_height, height)):
-                for x in range(region_x, min(region_x + region_width, width)):
-                    display_buffer[x, y] = 0
-            
-            title = self.current_article["title"]
-            
-            title_area_width = region_width - 4
-            title_area_height = region_height - 2
-            
-            if FLEXIBLE_FONTS:
-                # Use all available space, with configurable word wrap
-                word_wrap = self.config.get("word_wrap", True)
-                fit_and_draw_text(display_buffer, title, 
-                                 region_x + 2, region_y + 1,
-                                 title_area_width, title_area_height, white, max_lines=99, word_wrap=word_wrap)
-            else:
-                # Fallback to simple font
-                title_short = title[:12] + "..." if len(title) > 12 else title
-                draw_text(display_buffer, title_short, region_x + 2, region_y + 2, white)
-            
+            self._render_title(display_buffer, width, height)
             return True
             
         except Exception as e:
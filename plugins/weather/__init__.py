@@ -1,5 +1,8 @@
-import json
-import gc
+try:
+    from micropython import const
+except ImportError:
+    def const(value):
+        return value
 from core.plugin_interface import PluginInterface, PluginMetadata
 try:
     from core.flexible_fonts import fit_and_draw_text
@@ -9,12 +12,42 @@ except:
     FLEXIBLE_FONTS = False
     print("Using fallback fonts for weather")
 
+# Palette indices
+_WHITE = const(7)
+_YELLOW = const(5)
+_BLUE = const(4)
+
+# 8x8 weather icons, one byte per row with bit n set for column n
+_ICON_SUN = b'\x00\x00\x00\x38\x38\x38\x00\x00'  # filled disc
+_ICON_RAIN = b'\x54\x54\x54\x54\x54\x54\x54\x54'  # vertical streaks
+_ICON_CLOUD = b'\x00\x00\x6c\x36\x5a\x6c\x00\x00'  # lumpy shape
+_ICON_UNKNOWN = b'\x06\x09\x04\x02\x00\x02\x00\x00'  # question mark
+# Indexed by the id from _icon_id
+_ICONS = (_ICON_SUN, _ICON_RAIN, _ICON_CLOUD, _ICON_UNKNOWN)
+_ICON_ID_UNKNOWN = 3
+
+def _icon_id(condition):
+    """Classify a weather description into an index into _ICONS"""
+    condition_lower = condition.lower()
+    if "sun" in condition_lower or "clear" in condition_lower:
+        return 0
+    if "rain" in condition_lower:
+        return 1
+    if "cloud" in condition_lower:
+        return 2
+    return _ICON_ID_UNKNOWN
+
 class Plugin(PluginInterface):
     def __init__(self, config):
         super().__init__(config)
         self.network = None  # Will be set by plugin manager
         self.weather_data = None
+        self._icon_id = _ICON_ID_UNKNOWN  # index into _ICONS for the current condition, set on pull
         self.last_update = 0
+        self._temp_text = ""  # shown strings, see _format_text
+        self._location_text = ""
+        self._line_url = None  # one-line URL that weather_data was parsed from, if any
+        self._apply_layout()
         
     @property
     def metadata(self):
@@ -43,19 +76,20 @@ class Plugin(PluginInterface):
             if location == "auto":
                 location = ""  # wttr.in auto-detects based on IP
             
-            url = f"https://wttr.in/{location}?format=j1"
-            response = await self.network.fetch_json(url)
+            # The one-line format carries just the shown fields; the full JSON
+            # report is only needed if that fails
+            weather = await self._fetch_line(location)
+            if weather is not None and weather is self.weather_data:
+                # Unchanged since the last pull; nothing to re-parse or redraw
+                return weather
+            if not weather:
+                weather = await self._fetch_report(location)
             
-            if response and "current_condition" in response:
-                current = response["current_condition"][0]
-                self.weather_data = {
-                    "temp": current.get("temp_C", "?"),
-                    "condition": current.get("weatherDesc", [{}])[0].get("value", "Unknown"),
-                    "humidity": current.get("humidity", "?"),
-                    "wind": current.get("windspeedKmph", "?"),
-                    "location": response.get("nearest_area", [{}])[0].get("areaName", [{}])[0].get("value", "Unknown")
-                }
-                gc.collect()
+            if weather:
+                self.weather_data = weather
+                self._icon_id = _icon_id(weather["condition"])
+                self._format_text()
+                self._region_cache.invalidate()
                 return self.weather_data
                 
         except Exception as e:
@@ -63,125 +97,142 @@ class Plugin(PluginInterface):
             
         return None
     
+    async def _fetch_line(self, location):
+        """Fetch current conditions as a single line in wttr.in's custom format"""
+        url = f"https://wttr.in/{location}?format=%t|%C|%h|%w|%l&m"
+        text = await self.network.fetch_text(url, conditional=True)
+        if text is self.network.NOT_MODIFIED:
+            # Unchanged only means something if the last reply was parsed;
+            # otherwise the current data came from the JSON report
+            return self.weather_data if url == self._line_url else None
+        self._line_url = None
+        if not text:
+            return None
+        
+        parts = text.strip().split('|')
+        if len(parts) != 5:
+            return None
+        self._line_url = url
+        temp, condition, humidity, wind, area = parts
+        # e.g. "+12°C|Partly cloudy|71%|↗11km/h|London"
+        return {
+            "temp": temp.replace("°C", "").lstrip("+"),
+            "condition": condition,
+            "humidity": humidity.rstrip("%"),
+            "wind": "".join(c for c in wind if c.isdigit()) or "?",
+            "location": area.split(",")[0]
+        }
+    
+    async def _fetch_report(self, location):
+        """Fetch current conditions from the full JSON report"""
+        url = f"https://wttr.in/{location}?format=j1"
+        response = await self.network.fetch_json(url)
+        
+        if response and "current_condition" in response:
+            current = response["current_condition"][0]
+            try:
+                condition = current["weatherDesc"][0]["value"]
+            except (KeyError, IndexError, TypeError):
+                condition = "Unknown"
+            try:
+                area = response["nearest_area"][0]["areaName"][0]["value"]
+            except (KeyError, IndexError, TypeError):
+                area = "Unknown"
+            return {
+                "temp": current.get("temp_C", "?"),
+                "condition": condition,
+                "humidity": current.get("humidity", "?"),
+                "wind": current.get("windspeedKmph", "?"),
+                "location": area
+            }
+        return None
+    
+    def _apply_layout(self):
+        """Bind the draw method and default region height for the configured layout"""
+        if self.config.get("layout", "single_line") == "dual_line":
+            self._draw_impl, self._default_height = self._draw_dual_line, 20
+        else:
+            self._draw_impl, self._default_height = self._draw_single_line, 12
+    
+    def update_config(self, new_config):
+        layout = self.config.get("layout")
+        super().update_config(new_config)
+        if self.config.get("layout") != layout:
+            self._apply_layout()
+            # The default region height depends on the layout
+            self._invalidate_layout()
+        # location_short_name may have changed
+        if self.weather_data:
+            self._format_text()
+    
+    def _format_text(self):
+        """Build the shown strings once per pull or config change rather than per draw"""
+        self._temp_text = f"{self.weather_data['temp']}C"
+        self._location_text = self.config.get("location_short_name") or self.weather_data['location']
+    
     def render(self, display_buffer, width, height):
         """Render weather information based on configured layout."""
         if not self.weather_data:
             return False
             
         try:
-            layout = self.config.get("layout", "single_line") # Default to single_line
-            
-            if layout == "dual_line":
-                return self._render_dual_line(display_buffer, width, height)
-            else:
-                return self._render_single_line(display_buffer, width, height)
+            # Redrawn only after a pull or a layout/config change
+            self.render_cached(display_buffer, width, height, self._draw_impl, 0, self._default_height)
+            return True
                 
         except Exception as e:
             print(f"Weather render error: {e}")
             return False
 
-    def _render_single_line(self, display_buffer, width, height):
-        """Render weather in a compact, single-line format."""
-        screen_config = getattr(self, 'screen_config', {})
-        region_x = screen_config.get('x', 0)
-        region_y = screen_config.get('y', 0)
-        region_width = screen_config.get('width', width)
-        region_height = screen_config.get('height', 12)
-
-        # Colors
-        white = 7
-        yellow = 5
-        blue = 4
-
-        # Clear the region
-        for y in range(region_y, min(region_y + region_height, height)):
-            for x in range(region_x, min(region_x + region_width, width)):
-                display_buffer[x, y] = 0
+    def _draw_single_line(self, target):
+        """Draw weather in a compact, single-line format."""
+        region_x, region_y, region_width, region_height = self._geom
 
         # Icon
         icon_x = region_x + 2
         icon_y = region_y + (region_height - 8) // 2 # Center icon vertically
-        self._draw_weather_icon(display_buffer, icon_x, icon_y, self.weather_data['condition'], blue)
+        self._draw_weather_icon(target, icon_x, icon_y, _BLUE)
 
         # Temperature
-        temp_text = f"{self.weather_data['temp']}C"
         temp_x = icon_x + 10
-        fit_and_draw_text(display_buffer, temp_text, temp_x, region_y + 2, region_width - temp_x, 7, yellow, 1)
+        fit_and_draw_text(target, self._temp_text, temp_x, region_y + 2, region_width - temp_x, 7, _YELLOW, 1)
 
         # Location
-        location_text = self.config.get("location_short_name") or self.weather_data['location']
         location_x = temp_x + 22 # Position after temp
-        fit_and_draw_text(display_buffer, location_text, location_x, region_y + 2, region_width - location_x - 2, 7, white, 1)
-        
-        return True
-
-    def _render_dual_line(self, display_buffer, width, height):
-        """Render weather in a two-line format."""
-        screen_config = getattr(self, 'screen_config', {})
-        region_x = screen_config.get('x', 0)
-        region_y = screen_config.get('y', 0)
-        region_width = screen_config.get('width', width)
-        region_height = screen_config.get('height', 20)
+        fit_and_draw_text(target, self._location_text, location_x, region_y + 2, region_width - location_x - 2, 7, _WHITE, 1)
 
-        # Colors
-        white = 7
-        yellow = 5
-        blue = 4
-
-        # Clear the region
-        for y in range(region_y, min(region_y + region_height, height)):
-            for x in range(region_x, min(region_x + region_width, width)):
-                display_buffer[x, y] = 0
+    def _draw_dual_line(self, target):
+        """Draw weather in a two-line format."""
+        region_x, region_y, region_width, region_height = self._geom
 
         # Top Line: Icon and Temperature
         icon_x = region_x + 2
         icon_y = region_y + 1
-        self._draw_weather_icon(display_buffer, icon_x, icon_y, self.weather_data['condition'], blue)
+        self._draw_weather_icon(target, icon_x, icon_y, _BLUE)
         
-        temp_text = f"{self.weather_data['temp']}C"
         temp_x = icon_x + 12
-        fit_and_draw_text(display_buffer, temp_text, temp_x, region_y + 2, region_width - temp_x, 7, yellow, 1)
+        fit_and_draw_text(target, self._temp_text, temp_x, region_y + 2, region_width - temp_x, 7, _YELLOW, 1)
 
         # Bottom Line: Location
-        location_text = self.config.get("location_short_name") or self.weather_data['location']
-        fit_and_draw_text(display_buffer, location_text, region_x + 2, region_y + 10, region_width - 4, 7, white, 1)
-
-        return True
-    
-
+        fit_and_draw_text(target, self._location_text, region_x + 2, region_y + 10, region_width - 4, 7, _WHITE, 1)
     
-    def _draw_weather_icon(self, buffer, x, y, condition, color):
-        """Draw a simple weather icon"""
-        condition_lower = condition.lower()
-        
-        # Simple 8x8 weather icons using pixels
-        if "sun" in condition_lower or "clear" in condition_lower:
-            # Sun icon - circle with rays
-            for i in range(3, 6):
-                for j in range(3, 6):
-                    buffer[x + i, y + j] = color
-        elif "rain" in condition_lower:
-            # Rain icon - vertical lines
-            for i in range(2, 7, 2):
-                for j in range(8):
-                    buffer[x + i, y + j] = color
-        elif "cloud" in condition_lower:
-            # Cloud icon - lumpy shape
-            for i in range(1, 7):
-                for j in range(2, 6):
-                    if (i + j) % 3 != 0:
-                        buffer[x + i, y + j] = color
-        else:
-            # Default icon - question mark
-            pattern = [
-                [0,1,1,0],
-                [1,0,0,1],
-                [0,0,1,0],
-                [0,1,0,0],
-                [0,0,0,0],
-                [0,1,0,0]
-            ]
-            for py, row in enumerate(pattern):
-                for px, pixel in enumerate(row):
-                    if pixel and y + py < 64 and x + px < 64:
-                        buffer[x + px, y + py] = color
+    def _draw_weather_icon(self, buffer, x, y, color):
+        """Draw the 8x8 icon for the condition classified on the last pull"""
+        icon = _ICONS[self._icon_id]
+        # Clip to the 64x64 panel once rather than testing every pixel; like the
+        # text, the icon may extend past a short region
+        col_start = max(0, -x)
+        col_end = min(8, 64 - x)
+        if col_end <= col_start:
+            return
+        col_mask = (1 << col_end) - 1
+        for j in range(max(0, -y), min(8, 64 - y)):
+            # Drop clipped columns, then shift through the row until no set bits remain
+            row = (icon[j] & col_mask) >> col_start
+            pixel_x = x + col_start
+            pixel_y = y + j
+            while row:
+                if row & 1:
+                    buffer[pixel_x, pixel_y] = color
+                row >>= 1
+                pixel_x += 1